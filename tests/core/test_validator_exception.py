@@ -0,0 +1,26 @@
+from uhmactually.validator import ValidationException
+
+
+def received_line(value):
+    exception = ValidationException(
+        message="Value is invalid",
+        field_name="value",
+        received={"value": value},
+        expected={},
+    )
+    return next(line for line in str(exception).splitlines() if "| received:" in line)
+
+
+class TestReceivedRendering:
+    def test_large_number_is_shown_in_full(self):
+        assert received_line(10**50).endswith(f"{{'value': {10**50}}}")
+
+    def test_large_containers_are_bounded(self):
+        assert received_line(list(range(10**5))).endswith(
+            "{'value': [0, 1, 2, 3, ...]}"
+        )
+
+    def test_long_strings_are_bounded(self):
+        line = received_line("x" * 10**5)
+        assert "..." in line
+        assert len(line) < 150
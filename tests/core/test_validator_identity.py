@@ -0,0 +1,44 @@
+import functools
+
+from uhmactually.validator import ValidatedModel, validate
+from uhmactually.core.validator_number import min
+
+
+def doubled(func):
+    @functools.wraps(func)
+    def wrapper(self, value):
+        return func(self, value) * 2
+
+    return wrapper
+
+
+class TestIdentityField:
+    class TestModel(ValidatedModel):
+        @validate
+        def plain(self, value) -> int:
+            return value
+
+        @validate
+        @min(1)
+        def bounded(self, value) -> int:
+            return value
+
+        @validate
+        @doubled
+        def twice(self, value) -> int:
+            return value
+
+    def test_identity_fields_are_skipped(self):
+        fields = self.TestModel._validation_fields
+        assert fields["plain"]._is_identity
+        assert fields["bounded"]._is_identity
+
+        model = self.TestModel(plain=3, bounded=3, twice=3)
+        assert model.plain() == 3
+        assert model.bounded() == 3
+
+    def test_foreign_wrapper_still_runs(self):
+        assert not self.TestModel._validation_fields["twice"]._is_identity
+
+        model = self.TestModel(plain=3, bounded=3, twice=3)
+        assert model.twice() == 6
@@ -0,0 +1,90 @@
+import pytest
+
+from uhmactually.validator import (
+    ValidatedModel,
+    ValidationException,
+    ValidationInput,
+    ValidationResult,
+    Validator,
+    validate,
+    validator,
+    _validator_registry,
+)
+from uhmactually.core.validator_type import typed
+
+
+class TestValidationFields:
+    def make_model(self):
+        class TestModel(ValidatedModel):
+            @validate
+            def value(self, value) -> int:
+                return value
+
+        return TestModel
+
+    def test_fields_are_read_only(self):
+        model_class = self.make_model()
+        fields = model_class(value=1)._get_validation_fields()
+        assert list(fields) == ["value"]
+        with pytest.raises(TypeError):
+            fields["other"] = fields["value"]
+
+    def test_field_added_after_class_creation(self):
+        model_class = self.make_model()
+
+        def extra(self, value) -> int:
+            return value
+
+        model_class.extra = validate(typed(int)(extra))
+        with pytest.raises(ValidationException):
+            model_class(value=1, extra="1")
+
+        del model_class.extra
+        assert model_class(value=1)
+
+    def test_field_added_to_base_reaches_subclass(self):
+        model_class = self.make_model()
+
+        class SubModel(model_class):
+            pass
+
+        def extra(self, value) -> int:
+            return value
+
+        model_class.extra = validate(typed(int)(extra))
+        with pytest.raises(ValidationException):
+            SubModel(value=1, extra="1")
+
+
+class TestStatefulDefaultValidator:
+    @pytest.fixture
+    def recording_validator(self):
+        @validator
+        class RecordingValidator(Validator):
+            def __init__(self):
+                super().__init__()
+                self.seen = []
+
+            def validate(self, input: ValidationInput, **kwargs) -> ValidationResult:
+                return self.success()
+
+            def default(self, input: ValidationInput) -> ValidationResult:
+                if input.field_name != "recorded":
+                    return self.success()
+                self.seen.append(input.value)
+                if len(self.seen) > 1:
+                    return self.fail(f"seen {self.seen}")
+                return self.success()
+
+        yield RecordingValidator
+        del _validator_registry[RecordingValidator.registered_name()]
+
+    def test_stateful_validator_gets_fresh_instances(self, recording_validator):
+        class TestModel(ValidatedModel):
+            @validate
+            def recorded(self, value) -> int:
+                return value
+
+        assert not recording_validator.is_stateless()
+        assert TestModel(recorded=1).recorded() == 1
+        assert TestModel(recorded=2).recorded() == 2
@@ -1,4 +1,6 @@
 import pytest
+from decimal import Decimal
+from fractions import Fraction
 
 from uhmactually.validator import ValidatedModel, validate, ValidationException
 from uhmactually.core.validator_number import min
@@ -62,3 +64,30 @@ class TestMinNumberValidator:
     def test_min_value_failure(self, value):
         with pytest.raises(ValidationException):
             model = self.TestModel(value=value, value_custom=value)
+
+    @pytest.mark.parametrize("value", [None, "String", 12j])
+    def test_min_value_not_a_number(self, value):
+        with pytest.raises(ValidationException) as exc_info:
+            self.TestModel(value=value, value_custom=16)
+        assert exc_info.value.message == (
+            f"Value must be a number, got {type(value).__name__}"
+        )
+
+
+class TestMinNumberValidatorNumericTypes:
+    class TestModel(ValidatedModel):
+        @validate
+        @min(10)
+        def value(self, value):
+            return value
+
+    @pytest.mark.parametrize("value", [Decimal("12"), Fraction(12)])
+    def test_min_value_other_numbers_success(self, value):
+        model = self.TestModel(value=value)
+        assert model.value() == value
+
+    @pytest.mark.parametrize("value", [Decimal("9"), Fraction(9)])
+    def test_min_value_other_numbers_failure(self, value):
+        with pytest.raises(ValidationException) as exc_info:
+            self.TestModel(value=value)
+        assert exc_info.value.message == "Value must be at least 10"
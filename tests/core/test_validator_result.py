@@ -0,0 +1,31 @@
+import pytest
+
+from uhmactually.validator import ValidationResult
+from uhmactually.core.validator_none import AllowNoneValidator
+
+
+class TestSuccessResult:
+    validator = AllowNoneValidator()
+
+    def test_plain_success_is_shared(self):
+        assert self.validator.success() is self.validator.success()
+        assert self.validator.success().is_valid
+
+    def test_shared_success_is_read_only(self):
+        result = self.validator.success()
+        with pytest.raises(AttributeError):
+            result.value = 1
+        with pytest.raises(TypeError):
+            result.context["key"] = 1
+        assert result.value is None
+        assert dict(result.context) == {}
+
+    def test_success_with_value_is_fresh_and_mutable(self):
+        result = self.validator.success(1)
+        assert type(result) is ValidationResult
+        assert result is not self.validator.success(1)
+
+        result.value = 2
+        result.context["key"] = 1
+        assert result.value == 2
+        assert result.context == {"key": 1}
@@ -1,7 +1,10 @@
 import pytest
+import sys
+from unittest.mock import Mock
+from typing import Any, List, Optional
 from uhmactually.validator import ValidatedModel, validate
 from uhmactually.validator import ValidationException
-from uhmactually.core.validator_type import typed
+from uhmactually.core.validator_type import typed, _type_spec
 
 
 class TestTypeValidator:
@@ -39,3 +42,99 @@ class TestTypeValidator:
             model = self.TestModel(value=15, value_custom="15", value_no_type="15")
             model.value_custom()
             model.value_no_type()
+
+
+class TestTypeValidatorGenerics:
+    class TestModel(ValidatedModel):
+        @validate
+        def maybe(self, value) -> Optional[int]:
+            return value
+
+        @validate
+        def items(self, value) -> List[int]:
+            return value
+
+        @validate
+        @typed(Optional[str])
+        def label(self, value):
+            return value
+
+    def test_generic_annotation_success(self):
+        model = self.TestModel(maybe=1, items=[1, 2], label="a")
+        assert model.maybe() == 1
+        assert model.items() == [1, 2]
+        assert model.label() == "a"
+
+    @pytest.mark.parametrize(
+        "maybe, items, label", [("1", [1], "a"), (1, (1,), "a"), (1, [1], 1)]
+    )
+    def test_generic_annotation_failure(self, maybe, items, label):
+        with pytest.raises(ValidationException):
+            self.TestModel(maybe=maybe, items=items, label=label)
+
+    def test_typed_carries_resolved_spec(self):
+        (config,) = self.TestModel._validation_fields["label"]._validators
+        assert config["decorator_kwargs"]["spec"] is _type_spec(Optional[str])
+
+    def test_generic_annotation_failure_message(self):
+        with pytest.raises(ValidationException) as exc_info:
+            self.TestModel(maybe=1, items=(1,), label="a")
+        assert exc_info.value.message == "Value must be of type typing.List[int]"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="PEP 604 needs Python 3.10")
+class TestTypeValidatorPep604:
+    @pytest.fixture
+    def model_class(self):
+        # Built at run time, since `int | None` raises below Python 3.10.
+        class TestModel(ValidatedModel):
+            @validate
+            def count(self, value) -> int | None:
+                return value
+
+        return TestModel
+
+    def test_pep604_union_success(self, model_class):
+        assert model_class(count=2).count() == 2
+
+    def test_pep604_union_failure(self, model_class):
+        with pytest.raises(ValidationException):
+            model_class(count="1")
+
+
+class TestTypeValidatorAny:
+    class TestModel(ValidatedModel):
+        @validate
+        def anything(self, value) -> Any:
+            return value
+
+        @validate
+        def some_object(self, value) -> object:
+            return value
+
+    @pytest.mark.parametrize("value", [1, "1", [1], object()])
+    def test_any_annotation_accepts_every_value(self, value):
+        model = self.TestModel(anything=value, some_object=value)
+        assert model.anything() is value
+        assert model.some_object() is value
+
+
+class Foo:
+    pass
+
+
+class TestTypeValidatorInstanceCheck:
+    class TestModel(ValidatedModel):
+        @validate
+        @typed(Foo)
+        def foo(self, value):
+            return value
+
+    def test_typed_accepts_spec_mock(self):
+        mock = Mock(spec=Foo)
+        model = self.TestModel(foo=mock)
+        assert model.foo() is mock
+
+    def test_typed_rejects_other_types(self):
+        with pytest.raises(ValidationException):
+            self.TestModel(foo=object())
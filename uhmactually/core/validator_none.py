@@ -10,13 +10,16 @@ from typing import Callable
 
 @validator(accept_none=True)
 class AllowNoneValidator(Validator):
+    __slots__ = ()
+    _stateless = True
+
     def validate(self, input: ValidationInput, **kwargs) -> ValidationResult:
-        return self.success(input.value)
+        return self.success()
 
     def default(self, input: ValidationInput) -> ValidationResult:
         if input.value is None:
             return self.fail("Value cannot be None")
-        return self.success(input.value)
+        return self.success()
 
 
 def allow_none(func=None):
@@ -24,11 +27,10 @@ def allow_none(func=None):
     Decorator to validate that a value can be None.
     Can be used as @allow_none or @allow_none()
     """
-    from uhmactually.validator import validate
 
     def decorator(function):
         # Apply the validator
-        decorated = AllowNoneValidator().generate_decorator()(function)
+        decorated = AllowNoneValidator.shared_instance().generate_decorator()(function)
         return decorated
 
     # Direct decoration: @allow_none
@@ -4,32 +4,58 @@ from uhmactually.validator import (
     ValidationInput,
     ValidationResult,
 )
-from typing import Callable
+from typing import Any, Callable, Optional
+from decimal import Decimal
+import numbers
+
+# Decimal is registered only as numbers.Number, but it is ordered like a Real.
+_ORDERED_NUMBERS = (numbers.Real, Decimal)
+
+
+class _NumberValidator(Validator):
+    """Shared number guard and pass-through default for the bound validators."""
+
+    __slots__ = ()
+    _stateless = True
+
+    def _check_number(self, value: Any) -> Optional[ValidationResult]:
+        """Returns a failed result when value is not a number, None otherwise."""
+        value_type = type(value)
+        if (
+            value_type is int
+            or value_type is float
+            or isinstance(value, _ORDERED_NUMBERS)
+        ):
+            return None
+        return self.fail(f"Value must be a number, got {value_type.__name__}")
+
+    def default(self, input: ValidationInput) -> ValidationResult:
+        return self.success()
 
 
 @validator
-class MinNumberValidator(Validator):
+class MinNumberValidator(_NumberValidator):
+    __slots__ = ()
+
     def validate(self, input: ValidationInput, **kwargs) -> ValidationResult:
         value = input.value
         min_value = kwargs.get("min_value")
-        print(value, min_value)
+        failure = self._check_number(value)
+        if failure is not None:
+            return failure
         if value >= min_value:
-            return self.success(value)
+            return self.success()
         return self.fail(f"Value must be at least {min_value}")
 
-    def default(self, input: ValidationInput) -> ValidationResult:
-        return self.success(input.value)
-
 
 def min(min_value: int) -> Callable:
     """Decorator to validate that a number is at least min_value."""
 
     def decorator(func):
-        # Use the validate decorator to mark this as a validation field
-        from uhmactually.validator import validate
-
         # Apply the validator
-        decorated = MinNumberValidator().generate_decorator(min_value=min_value)(func)
+        decorated = MinNumberValidator.shared_instance().generate_decorator(
+            min_value=min_value
+        )(func)
 
         return decorated
 
@@ -37,24 +63,28 @@ def min(min_value: int) -> Callable:
 
 
 @validator
-class MaxNumberValidator(Validator):
+class MaxNumberValidator(_NumberValidator):
+    __slots__ = ()
+
     def validate(self, input: ValidationInput, **kwargs) -> ValidationResult:
         value = input.value
         max_value = kwargs.get("max_value")
+        failure = self._check_number(value)
+        if failure is not None:
+            return failure
         if value <= max_value:
-            return self.success(value)
+            return self.success()
         return self.fail(f"Value must be at most {max_value}")
 
-    def default(self, input: ValidationInput) -> ValidationResult:
-        return self.success(input.value)
-
 
 def max(max_value: int) -> Callable:
     """Decorator to validate that a number is at most max_value."""
 
     def decorator(func):
         # Apply the validator
-        decorated = MaxNumberValidator().generate_decorator(max_value=max_value)(func)
+        decorated = MaxNumberValidator.shared_instance().generate_decorator(
+            max_value=max_value
+        )(func)
 
         return decorated
 
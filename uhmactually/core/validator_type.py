@@ -4,44 +4,131 @@ from uhmactually.validator import (
     ValidationInput,
     ValidationResult,
 )
-from typing import Callable, Type
+from typing import Any, Callable, Optional, Type, Union, get_args, get_origin
+import functools
 import inspect
+import types
+
+# PEP 604 unions (int | None) report types.UnionType as their origin.
+_UNION_ORIGINS = tuple(
+    origin for origin in (Union, getattr(types, "UnionType", None)) if origin
+)
+
+
+def _accepts_anything(annotation: Any) -> bool:
+    """Checks whether an annotation admits every value."""
+    return annotation is Any or annotation is object
+
+
+def _return_true(value: Any) -> bool:
+    return True
+
+
+def _union_tuple(args: tuple) -> Optional[tuple]:
+    """Flattens union members into a tuple of classes for a single isinstance.
+
+    Parameterised generics contribute their container origin, matching the
+    shallow generic check. Returns None when a member is not a plain class.
+    """
+    classes = []
+    for arg in args:
+        origin = get_origin(arg)
+        target = arg if origin is None else origin
+        if not isinstance(target, type):
+            return None
+        classes.append(target)
+    return tuple(classes)
+
+
+class _TypeSpec:
+    """A return annotation resolved once into its typing origin and arguments."""
+
+    __slots__ = ("annotation", "origin", "args", "check", "message")
+
+    def __init__(self, annotation: Any):
+        # Rendering typing constructs is slow, so the failure text is built once.
+        self.message = f"Value must be of type {annotation}"
+        if annotation is None:
+            # A "-> None" annotation means the value itself must be None.
+            annotation = type(None)
+        self.annotation = annotation
+        self.origin = get_origin(annotation)
+        self.args = get_args(annotation)
+        self.check = self._compile_check()
+
+    def _compile_check(self) -> Callable[[Any], bool]:
+        """Selects the predicate for this annotation's shape once, up front."""
+        if _accepts_anything(self.annotation):
+            return _return_true
+        if self.origin in _UNION_ORIGINS:
+            if any(_accepts_anything(arg) for arg in self.args):
+                return _return_true
+            classes = _union_tuple(self.args)
+            if classes is not None:
+                # isinstance accepts a tuple and checks every member in one call.
+                return lambda value: isinstance(value, classes)
+            checks = tuple(_type_spec(arg).check for arg in self.args)
+            return lambda value: any(check(value) for check in checks)
+        if self.origin is not None:
+            # Parameterised generics are checked against their container type.
+            origin = self.origin
+            return lambda value: isinstance(value, origin)
+        annotation = self.annotation
+        return lambda value: isinstance(value, annotation)
+
+
+@functools.lru_cache(maxsize=1024)
+def _type_spec(annotation: Any) -> _TypeSpec:
+    """Returns the cached _TypeSpec for an annotation."""
+    return _TypeSpec(annotation)
+
+
+@functools.lru_cache(maxsize=1024)
+def _field_type_spec(definition: Callable) -> Optional[_TypeSpec]:
+    """Returns the cached _TypeSpec for a field's return annotation, if any."""
+    annotation = inspect.signature(definition).return_annotation
+    if annotation is inspect.Signature.empty:
+        return None
+    return _type_spec(annotation)
 
 
 @validator
 class TypeValidator(Validator):
+    __slots__ = ()
+    _stateless = True
+
     def validate(self, input: ValidationInput, **kwargs) -> ValidationResult:
         value = input.value
-        type = kwargs.get("type")
-        print(value, type)
-        if isinstance(value, type):
-            return self.success(value)
-        return self.fail(f"Value must be of type {type}")
+        spec = kwargs.get("spec")
+        if spec is None:  # generate_decorator(type=...) called directly
+            spec = _type_spec(kwargs.get("type"))
+        if spec.check(value):
+            return self.success()
+        return self.fail(spec.message)
 
     def default(self, input: ValidationInput) -> ValidationResult:
-        method = input.definition
-
-        inspect_type = inspect.signature(method).return_annotation
-        print(inspect_type)
+        spec = _field_type_spec(input.definition)
 
-        if inspect_type == inspect.Signature.empty:
-            return self.success(input.value)
+        if spec is None:
+            return self.success()
         # else fail if not derived from expected type
-        elif not issubclass(type(input.value), inspect_type):
-            return self.fail(f"Value must be of type {inspect_type}")
+        elif not spec.check(input.value):
+            return self.fail(spec.message)
         else:
-            return self.success(input.value)
+            return self.success()
 
 
 def typed(type: Type) -> Callable:
-    """Decorator to validate that a number is at least min_value."""
+    """Decorator to validate that a value is of the given type."""
 
-    def decorator(func):
-        # Use the validate decorator to mark this as a validation field
-        from uhmactually.validator import validate
+    # Resolved once here and carried to validate with the decorator kwargs.
+    spec = _type_spec(type)
 
+    def decorator(func):
         # Apply the validator
-        decorated = TypeValidator().generate_decorator(type=type)(func)
+        decorated = TypeValidator.shared_instance().generate_decorator(
+            type=type, spec=spec
+        )(func)
 
         return decorated
 
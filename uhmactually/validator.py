@@ -3,21 +3,40 @@ from typing import (
     Callable,
     Dict,
     List,
+    Mapping,
     Any,
     Optional,
     get_type_hints,
     Type,
     Union,
 )
-from abc import ABC, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod
 import inspect
 import functools
+import reprlib
+from types import MappingProxyType
 
 T = TypeVar("T")
 
 _validator_registry: Dict[str, Dict[str, Any]] = {}
 
 
+@functools.lru_cache(maxsize=1024)
+def _return_annotation(definition: Callable) -> Optional[Type]:
+    """Returns the return annotation of a field definition, cached per definition."""
+    annotations = getattr(definition, "__annotations__", None)
+    if annotations is None:
+        return None
+
+    return annotations.get("return")
+
+
+@functools.lru_cache(maxsize=1024)
+def _resolved_return_type(definition: Callable) -> Any:
+    """Returns the resolved return type hint of a field definition, or Any."""
+    return get_type_hints(definition).get("return", Any)
+
+
 def validator(validator_class=None, *, accept_none=False):
     """
     Decorator to register a Validator class in the global registry.
@@ -44,6 +63,29 @@ def validator(validator_class=None, *, accept_none=False):
     return decorator
 
 
+def _identity_field(self, value):
+    return value
+
+
+def _is_identity_field(func: Callable) -> bool:
+    """Checks whether a field body is just `return value`, so it need not be called."""
+    # Only the package's own pass-through wrappers are unwrapped; a foreign
+    # functools.wraps decorator may change the result and must still run.
+    while getattr(type(func), "_is_transparent_wrapper", False):
+        func = func.func
+    if not inspect.isfunction(func):
+        return False
+
+    code = func.__code__
+
+    return (
+        code.co_argcount == 2
+        and code.co_kwonlyargcount == 0
+        and not code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS)
+        and code.co_code == _identity_field.__code__.co_code
+    )
+
+
 def validate(field_func: Callable) -> Callable:
     """Marks a method as a validated field in ValidatedModel subclasses."""
 
@@ -53,6 +95,8 @@ def validate(field_func: Callable) -> Callable:
             self._is_validation_field = True
             self._validators = getattr(func, "_validators", [])
             functools.update_wrapper(self, func)
+            self._is_identity = _is_identity_field(func)
+            self._param_count = len(inspect.signature(func).parameters)
 
         def __get__(self, obj, objtype=None):
             if obj is None:
@@ -85,6 +129,8 @@ def validate(field_func: Callable) -> Callable:
 class ValidationInput:
     """Container for data being validated with its metadata."""
 
+    __slots__ = ("value", "field_name", "definition", "model_instance")
+
     def __init__(
         self, value: Any, field_name: str, definition: Callable, model_instance=None
     ):
@@ -95,10 +141,7 @@ class ValidationInput:
 
     def get_type(self) -> Optional[Type]:
         """Extracts type annotation from the field definition."""
-        if not hasattr(self.definition, "__annotations__"):
-            return None
-
-        return self.definition.__annotations__.get("return")
+        return _return_annotation(self.definition)
 
     def create_context(self) -> dict:
         """Creates a context dictionary with all relevant validation information."""
@@ -112,6 +155,8 @@ class ValidationInput:
 class ValidationResult:
     """Result of a validation operation with status, message, and transformed value."""
 
+    __slots__ = ("is_valid", "message", "value", "context")
+
     def __init__(
         self,
         is_valid: bool,
@@ -125,11 +170,37 @@ class ValidationResult:
         self.context = context or {}
 
 
+class _FrozenValidationResult(ValidationResult):
+    """A read-only ValidationResult that can be shared between validations."""
+
+    __slots__ = ()
+
+    def __init__(self, is_valid: bool):
+        object.__setattr__(self, "is_valid", is_valid)
+        object.__setattr__(self, "message", None)
+        object.__setattr__(self, "value", None)
+        object.__setattr__(self, "context", MappingProxyType({}))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"shared validation result is read-only: {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"shared validation result is read-only: {name}")
+
+
+_SUCCESS = _FrozenValidationResult(is_valid=True)
+
+
 class Validator(ABC):
     """Abstract base class for all validators."""
 
+    __slots__ = ("validator_type",)
+
+    # Validators that keep no per-instance state opt in to instance sharing.
+    _stateless = False
+
     def __init__(self):
-        self.validator_type = self.__class__.__name__.lower().replace("validator", "")
+        self.validator_type = self.registered_name()
 
     @abstractmethod
     def validate(self, input: ValidationInput, **kwargs) -> ValidationResult:
@@ -141,10 +212,24 @@ class Validator(ABC):
         return self.success()
 
     @classmethod
+    @functools.cache
     def registered_name(cls) -> str:
         """Returns validator name for registry lookup."""
         return cls.__name__.lower().replace("validator", "")
 
+    @classmethod
+    @functools.cache
+    def is_stateless(cls) -> bool:
+        """Checks whether one instance can serve every validation of this class."""
+        # A subclass that adds an instance __dict__ may keep state again.
+        return cls._stateless and not cls.__dictoffset__
+
+    @classmethod
+    @functools.cache
+    def shared_instance(cls) -> "Validator":
+        """Returns a single reusable instance of a stateless validator class."""
+        return cls()
+
     def generate_decorator(self, **kwargs) -> Callable:
         """Creates a decorator that applies this validator to model fields."""
         decorator_kwargs = kwargs
@@ -152,6 +237,9 @@ class Validator(ABC):
 
         def decorator(func):
             class MethodWrapper:
+                # Calls straight through to func, see _is_identity_field.
+                _is_transparent_wrapper = True
+
                 def __init__(self, func):
                     self.func = func
                     self._validators = getattr(func, "_validators", [])
@@ -189,13 +277,45 @@ class Validator(ABC):
         return ValidationResult(is_valid=False, message=message, context=context)
 
     def success(self, value: Any = None, context=None) -> ValidationResult:
-        """Creates a successful validation result with optional transformed value."""
-        return ValidationResult(is_valid=True, value=value, context=context or {})
+        """Creates a successful validation result with optional transformed value.
 
+        Without a value or context this returns a shared read-only result; pass
+        them here rather than setting them on the returned result.
+        """
+        if value is None and not context:
+            return _SUCCESS
+        return ValidationResult(is_valid=True, value=value, context=context)
 
-class ValidatedModel(ABC):
+
+class _ValidatedModelMeta(ABCMeta):
+    """Keeps each model's cached validation fields in step with its attributes."""
+
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        if name != "_validation_fields":
+            cls._refresh_validation_fields()
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        cls._refresh_validation_fields()
+
+    def _refresh_validation_fields(cls):
+        """Recollects the @validate methods of a model and of its subclasses."""
+        cls._validation_fields = MappingProxyType(cls._collect_validation_fields())
+        # Subclasses inherit the changed attribute, so their caches are stale too.
+        for subclass in cls.__subclasses__():
+            subclass._refresh_validation_fields()
+
+
+class ValidatedModel(ABC, metaclass=_ValidatedModelMeta):
     """Base class for models with field validation."""
 
+    _validation_fields: Mapping[str, Callable] = MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._refresh_validation_fields()
+
     def __init__(self, **kwargs):
         self._fields = {}
         self._cached_values = {}
@@ -210,25 +330,23 @@ class ValidatedModel(ABC):
         if name.startswith("_") or name == "validate":
             return super().__getattribute__(name)
 
+        getattribute = super().__getattribute__
         try:
-            wrapped_values = super().__getattribute__("_wrapped_values")
-            if name in wrapped_values:
-                return wrapped_values[name]
-        except (AttributeError, KeyError):
-            pass
+            wrapped_values = getattribute("_wrapped_values")
+            cached_values = getattribute("_cached_values")
+        except AttributeError:
+            return getattribute(name)
 
-        try:
-            cached_values = super().__getattribute__("_cached_values")
-            if name in cached_values:
-                value = cached_values[name]
-                wrapper = CallableValue(value, self, name)
-                wrapped_values = super().__getattribute__("_wrapped_values")
-                wrapped_values[name] = wrapper
-                return wrapper
-        except (AttributeError, KeyError):
-            pass
-
-        return super().__getattribute__(name)
+        wrapper = wrapped_values.get(name)
+        if wrapper is not None:
+            return wrapper
+
+        if name in cached_values:
+            wrapper = CallableValue(cached_values[name], self, name)
+            wrapped_values[name] = wrapper
+            return wrapper
+
+        return getattribute(name)
 
     def validate(self):
         """Validates all fields in the model and raises ValidationException on failure."""
@@ -244,20 +362,30 @@ class ValidatedModel(ABC):
         self._validate_custom()
 
     def _get_validation_fields(self):
+        """Returns a read-only view of the methods marked with @validate."""
+        return self._validation_fields
+
+    @classmethod
+    def _collect_validation_fields(cls):
         """Finds all methods marked with @validate."""
         validation_fields = {}
-        for name, method in inspect.getmembers(self.__class__):
+        for name, method in inspect.getmembers(cls):
             if hasattr(method, "_is_validation_field") and method._is_validation_field:
                 validation_fields[name] = method
         return validation_fields
 
     def _validate_field(self, field_name, field_method, field_value):
         """Validates a single field using its method and attached validators."""
-        sig = inspect.signature(field_method)
-        param_count = len(sig.parameters)
+        is_identity = getattr(field_method, "_is_identity", False)
+        if not is_identity:
+            param_count = getattr(field_method, "_param_count", None)
+            if param_count is None:
+                param_count = len(inspect.signature(field_method).parameters)
 
         try:
-            if param_count == 1:  # Just self
+            if is_identity:  # `return value` body, nothing to call
+                result = field_value
+            elif param_count == 1:  # Just self
                 result = field_method(self)
             elif param_count == 2:  # self and input
                 result = field_method(self, field_value)
@@ -269,7 +397,7 @@ class ValidatedModel(ABC):
             self._cached_values[field_name] = result
         except Exception as e:
             if not isinstance(e, ValidationException):
-                expected_type = get_type_hints(field_method).get("return", Any)
+                expected_type = _resolved_return_type(field_method)
                 raise ValidationException(
                     message=str(e),
                     field_name=field_name,
@@ -278,6 +406,14 @@ class ValidatedModel(ABC):
                 )
             raise
 
+        # One input is shared by every validator that runs on this field.
+        validation_input = ValidationInput(
+            value=field_value,
+            field_name=field_name,
+            definition=field_method,
+            model_instance=self,
+        )
+
         explicit_validators = []
         if hasattr(field_method, "_validators") and field_method._validators:
             explicit_validators = field_method._validators
@@ -286,46 +422,35 @@ class ValidatedModel(ABC):
                 validator_kwargs = validator_config["decorator_kwargs"]
                 validator_instance = validator_config["validator"]
                 self._run_validator(
-                    validator_instance,
-                    field_name,
-                    field_method,
-                    field_value,
-                    **validator_kwargs,
+                    validator_instance, validation_input, **validator_kwargs
                 )
 
-        self._run_default_validators(
-            field_name, field_method, field_value, explicit_validators
-        )
+        self._run_default_validators(validation_input, explicit_validators)
 
-    def _run_default_validators(
-        self, field_name, field_method, field_value, explicit_validators
-    ):
+    def _run_default_validators(self, validation_input, explicit_validators):
         """Runs default validators that aren't explicitly attached to the field."""
+        field_name = validation_input.field_name
+        used_validator_types = {
+            v["validator"].validator_type if isinstance(v, dict) else v.validator_type
+            for v in explicit_validators
+            if isinstance(v, dict) or hasattr(v, "validator_type")
+        }
+
         for validator_type, validator_config in _validator_registry.items():
+            if validator_type in used_validator_types:
+                continue
+
             validator_class = validator_config["validator"]
             accept_none = validator_config["accept_none"]
 
-            validator_already_used = any(
-                isinstance(v, dict)
-                and v["validator"].validator_type == validator_type
-                or hasattr(v, "validator_type")
-                and v.validator_type == validator_type
-                for v in explicit_validators
-            )
-
-            if validator_already_used:
-                continue
-
+            field_value = validation_input.value
             if field_value is None and not accept_none:
                 continue
 
-            validator_instance = validator_class()
-            validation_input = ValidationInput(
-                value=field_value,
-                field_name=field_name,
-                definition=field_method,
-                model_instance=self,
-            )
+            if validator_class.is_stateless():
+                validator_instance = validator_class.shared_instance()
+            else:
+                validator_instance = validator_class()
 
             try:
                 result = validator_instance.default(validation_input)
@@ -341,7 +466,7 @@ class ValidatedModel(ABC):
                         },
                     )
                 elif result.value is not None:
-                    field_value = result.value
+                    validation_input.value = result.value
                     setattr(self, field_name, result.value)
             except Exception as e:
                 if not isinstance(e, ValidationException):
@@ -356,21 +481,10 @@ class ValidatedModel(ABC):
                     )
                 raise
 
-    def _run_validator(
-        self,
-        validator_instance,
-        field_name,
-        field_method,
-        field_value,
-        **validator_kwargs,
-    ):
+    def _run_validator(self, validator_instance, validation_input, **validator_kwargs):
         """Runs a validator against a field."""
-        validation_input = ValidationInput(
-            value=field_value,
-            field_name=field_name,
-            definition=field_method,
-            model_instance=self,
-        )
+        field_name = validation_input.field_name
+        field_value = validation_input.value
 
         try:
             result = validator_instance.validate(validation_input, **validator_kwargs)
@@ -399,6 +513,18 @@ class ValidatedModel(ABC):
         pass
 
 
+# Bounds the received values shown in error reports, so large inputs are
+# summarised instead of being stringified in full.
+_RECEIVED_REPR = reprlib.Repr()
+_RECEIVED_REPR.maxstring = 100
+_RECEIVED_REPR.maxother = 100
+_RECEIVED_REPR.maxlong = 100
+_RECEIVED_REPR.maxlist = 4
+_RECEIVED_REPR.maxtuple = 4
+_RECEIVED_REPR.maxset = 4
+_RECEIVED_REPR.maxdict = 4
+
+
 class ValidationException(Exception):
     """Exception raised when validation fails."""
 
@@ -413,7 +539,8 @@ class ValidationException(Exception):
         self.field_name = field_name
         self.received = received
         self.expected = expected
-        super().__init__(self.format_error())
+        # The report is only rendered when the exception is displayed.
+        super().__init__(message)
 
     def format_error(self) -> str:
         """Formats the validation error in a Rust-style with visual indicators."""
@@ -426,14 +553,15 @@ class ValidationException(Exception):
         error_lines.append(f"   | {self.message}")
         error_lines.append(f"   |")
 
-        received_str = str(self.received)
+        received_str = _RECEIVED_REPR.repr(self.received)
         error_lines.append(f"   | received: {received_str}")
 
         problem_key = self.field_name
-        highlight_pos = self._find_highlight_position(received_str, problem_key)
+        key_to_highlight, highlight_pos = self._find_highlight(
+            received_str, problem_key
+        )
 
         if highlight_pos >= 0:
-            key_to_highlight = self._get_key_to_highlight(received_str, problem_key)
             pad = " " * (len("   | received: ") + highlight_pos)
             error_lines.append(
                 f"   |           {pad}{'^' * (len(str(key_to_highlight)) + 2)}"
@@ -452,26 +580,17 @@ class ValidationException(Exception):
 
         return "\n".join(error_lines)
 
-    def _find_highlight_position(self, received_str, problem_key):
-        """Finds the position to highlight in the received string."""
-        highlight_pos = -1
+    def _find_highlight(self, received_str, problem_key):
+        """Finds the key to highlight and its position in the received string."""
+        highlight_pos = received_str.find(f"'{problem_key}'")
+        if highlight_pos >= 0:
+            return problem_key, highlight_pos
 
-        if f"'{problem_key}'" in received_str:
-            highlight_pos = received_str.find(f"'{problem_key}'")
-        elif "." in problem_key:
+        if "." in problem_key:
             nested_key = problem_key.split(".")[-1]
-            if f"'{nested_key}'" in received_str:
-                highlight_pos = received_str.find(f"'{nested_key}'")
+            return nested_key, received_str.find(f"'{nested_key}'")
 
-        return highlight_pos
-
-    def _get_key_to_highlight(self, received_str, problem_key):
-        """Determines which key to highlight in the error message."""
-        if f"'{problem_key}'" in received_str:
-            return problem_key
-        elif "." in problem_key:
-            return problem_key.split(".")[-1]
-        return problem_key
+        return problem_key, -1
 
     def _generate_help_message(self, problem_key):
         """Generates a helpful message for fixing the validation error."""
@@ -486,6 +605,8 @@ class ValidationException(Exception):
 class CallableValue:
     """Value wrapper that enables getter/setter behavior while preserving comparison operations."""
 
+    __slots__ = ("value", "instance", "field_name")
+
     def __init__(self, value, instance, field_name):
         self.value = value
         self.instance = instance